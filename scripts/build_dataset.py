@@ -1,29 +1,94 @@
 import argparse
+import functools
+import hashlib
 import json
 import re
 from collections import defaultdict
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
 import html as html_lib
 
 import requests
 import yaml
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
 
-def _load_openapi(path: Path) -> Dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+def _cache_path_for(path: Path) -> Path:
+    # data/api.yaml -> data/api.yaml.cache.json
+    return path.with_name(path.name + ".cache.json")
+
+
+def _has_non_str_keys(obj: Any) -> bool:
+    stack: List[Any] = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if not all(isinstance(k, str) for k in node):
+                return True
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return False
+
+
+def _load_openapi(path: Path, *, use_cache: bool = True) -> Dict[str, Any]:
+    raw = path.read_bytes()
+    sha = hashlib.sha256(raw).hexdigest()
+    cache_path = _cache_path_for(path)
+
+    if use_cache and cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = None
+        if isinstance(cached, dict) and cached.get("sha") == sha and isinstance(cached.get("doc"), dict):
+            return cached["doc"]
+
+    data = yaml.load(raw, Loader=_SafeLoader)
     if not isinstance(data, dict) or "paths" not in data:
         raise ValueError(f"Not an OpenAPI document: {path}")
+
+    # JSON would turn non-string YAML keys (e.g. unquoted `200:`) into strings, so a cached
+    # run would see a different document than a cold one; only cache specs that round-trip.
+    if use_cache and not _has_non_str_keys(data):
+        try:
+            cache_path.write_text(json.dumps({"sha": sha, "doc": data}, ensure_ascii=False), encoding="utf-8")
+        except (OSError, TypeError, ValueError):
+            # Non-JSON YAML values (e.g. dates) or a read-only data dir: just skip the cache.
+            pass
     return data
 
 
+_HTTP_METHODS = ("get", "post", "put", "patch", "delete", "head", "options")
+# Methods whose operations get a ReadMe reference page usable as the docs seed
+_SEED_METHODS = ("get", "post", "put", "patch", "delete")
+
+# Synthesized response examples rarely need deep nesting, and each level multiplies the work.
+_DATASET_EXAMPLE_MAX_DEPTH = 4
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
 def _jsonable(obj: Any) -> Any:
-    try:
-        json.dumps(obj)
+    # Spec data is almost always JSON-native already; only stringify what isn't (e.g. YAML dates).
+    if isinstance(obj, _JSON_SCALARS):
         return obj
-    except TypeError:
-        return str(obj)
+    if isinstance(obj, dict):
+        return {str(k): _jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(v) for v in obj]
+    return str(obj)
 
 
 def _pick_response_example(response: Dict[str, Any]) -> Optional[Any]:
@@ -81,62 +146,124 @@ def _get_media_schema(response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 
 
 _REF_RE = re.compile(r"#/components/schemas/([^/]+)$")
+# Same match as _REF_RE, but against `"$ref": "..."` pairs inside serialized JSON.
+# Refs into other documents (e.g. "common.yaml#/components/schemas/X") count too.
+_REF_JSON_RE = re.compile(r'"\$ref"\s*:\s*"[^"#]*#/components/schemas/([^"/]+)"')
 
 
 def _collect_schema_refs(schema: Any) -> Set[str]:
-    refs: Set[str] = set()
-    stack: List[Any] = [schema]
-    while stack:
-        node = stack.pop()
-        if isinstance(node, dict):
-            ref = node.get("$ref")
-            if isinstance(ref, str):
-                m = _REF_RE.search(ref)
-                if m:
-                    refs.add(m.group(1))
-            for v in node.values():
-                stack.append(v)
-        elif isinstance(node, list):
-            stack.extend(node)
-    return refs
+    # One C-level dump + regex sweep is much cheaper than walking every node in Python.
+    return set(_REF_JSON_RE.findall(json.dumps(schema, ensure_ascii=False, default=str)))
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_ref_name(ref: str) -> Optional[str]:
+    m = _REF_RE.search(ref)
+    return m.group(1) if m else None
+
+
+_MISSING = object()
+
+# Placeholder values for scalar schema types; a missing type is treated as a string.
+_LEAF_EXAMPLES: Dict[Optional[str], Any] = {
+    "integer": 0,
+    "number": 0,
+    "boolean": True,
+    "string": "",
+    None: "",
+}
+
+# Keys that make a schema more than a plain scalar leaf
+_COMPOSITE_SCHEMA_KEYS = frozenset(("oneOf", "anyOf", "allOf", "properties"))
 
 
 class _ExampleBuilder:
-    def __init__(self, components_schemas: Dict[str, Any]):
+    def __init__(self, components_schemas: Dict[str, Any], *, max_depth: int = 6):
         self._schemas = components_schemas
-
-    def _resolve_ref(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        self._max_depth = max_depth
+        # Built examples per component schema, with the components expanded inside them.
+        # Results are shared between endpoints, so they must never be mutated.
+        self._cache: Dict[Tuple[str, int], Tuple[Any, FrozenSet[str]]] = {}
+        # Component schemas currently being built (cycle guard for self-referencing schemas)
+        self._building: Set[str] = set()
+        # Set when the cycle guard cut a subtree short; such results depend on the ancestors and aren't cached.
+        self._hit_cycle = False
+        # Components expanded in the subtree currently being built
+        self._expanded: Set[str] = set()
+
+    def _ref_name(self, schema: Dict[str, Any]) -> Optional[str]:
         ref = schema.get("$ref")
         if not isinstance(ref, str):
-            return schema
-        m = _REF_RE.search(ref)
-        if not m:
-            return schema
-        name = m.group(1)
-        resolved = self._schemas.get(name)
-        return resolved if isinstance(resolved, dict) else schema
+            return None
+        name = _schema_ref_name(ref)
+        if name is None:
+            return None
+        return name if isinstance(self._schemas.get(name), dict) else None
 
     def build(self, schema: Dict[str, Any], *, depth: int = 0) -> Any:
-        if depth > 6:
+        if depth > self._max_depth:
             return None
 
-        schema = self._resolve_ref(schema)
-
-        if "example" in schema:
-            return schema.get("example")
+        name = self._ref_name(schema)
+        if name is None:
+            return self._build_node(schema, depth=depth)
 
-        enum = schema.get("enum")
+        # Check the cycle guard first: a self-reference must stop here, not pick up a cached copy of itself.
+        if name in self._building:
+            self._hit_cycle = True
+            return None
+        # Keyed by depth as well, since the depth limit can truncate the same schema differently.
+        # A cached result is only valid if it didn't expand anything that is an ancestor here;
+        # building it fresh would cut that component off at the cycle guard.
+        key = (name, depth)
+        cached = self._cache.get(key)
+        if cached is not None and self._building.isdisjoint(cached[1]):
+            self._expanded |= cached[1]
+            return cached[0]
+
+        outer_hit_cycle = self._hit_cycle
+        outer_expanded = self._expanded
+        self._hit_cycle = False
+        self._expanded = {name}
+        self._building.add(name)
+        try:
+            result = self._build_node(self._schemas[name], depth=depth)
+        finally:
+            self._building.discard(name)
+            hit_cycle = self._hit_cycle
+            expanded = self._expanded
+            self._hit_cycle = outer_hit_cycle or hit_cycle
+            self._expanded = outer_expanded | expanded
+        if not hit_cycle:
+            self._cache[key] = (result, frozenset(expanded))
+        return result
+
+    def _build_node(self, schema: Dict[str, Any], *, depth: int) -> Any:
+        g = schema.get
+
+        example = g("example", _MISSING)
+        if example is not _MISSING:
+            return example
+
+        enum = g("enum")
         if isinstance(enum, list) and enum:
             return enum[0]
 
+        # Fast path for plain scalar leaves, by far the most common node.
+        schema_type = g("type")
+        if (schema_type is None or isinstance(schema_type, str)) and schema.keys().isdisjoint(_COMPOSITE_SCHEMA_KEYS):
+            leaf = _LEAF_EXAMPLES.get(schema_type, _MISSING)
+            if leaf is not _MISSING:
+                return leaf
+
         for combiner in ("oneOf", "anyOf"):
-            options = schema.get(combiner)
+            options = g(combiner)
             if isinstance(options, list) and options:
                 first = options[0]
                 if isinstance(first, dict):
                     return self.build(first, depth=depth + 1)
 
-        all_of = schema.get("allOf")
+        all_of = g("allOf")
         if isinstance(all_of, list) and all_of:
             merged: Dict[str, Any] = {}
             for part in all_of:
@@ -151,8 +278,7 @@ class _ExampleBuilder:
             if isinstance(first, dict):
                 return self.build(first, depth=depth + 1)
 
-        schema_type = schema.get("type")
-        properties = schema.get("properties")
+        properties = g("properties")
         if schema_type == "object" or isinstance(properties, dict):
             result: Dict[str, Any] = {}
             if isinstance(properties, dict):
@@ -166,21 +292,14 @@ class _ExampleBuilder:
             return result
 
         if schema_type == "array":
-            items = schema.get("items")
+            items = g("items")
             if isinstance(items, dict):
                 item_ex = self.build(items, depth=depth + 1)
                 return [item_ex] if item_ex is not None else []
             return []
 
-        if schema_type == "integer":
-            return 0
-        if schema_type == "number":
-            return 0
-        if schema_type == "boolean":
-            return True
-        # default string/null
-        if schema_type == "string" or schema_type is None:
-            return ""
+        if schema_type is None or isinstance(schema_type, str):
+            return _LEAF_EXAMPLES.get(schema_type)
         return None
 
 
@@ -194,32 +313,96 @@ def _slug_for_endpoint(method: str, path: str) -> str:
     return f"{method.lower()}_{'-'.join(parts)}"
 
 
-def _load_readme_schema(seed_url: str, *, timeout_s: int = 30) -> Optional[Dict[str, Any]]:
-    # ReadMe embeds a large JSON state in the `ssr-props` script tag.
-    resp = requests.get(seed_url, timeout=timeout_s)
+_INITIAL_PROPS_RE = re.compile(rb'data-initial-props="([^"]*)"')
+
+
+# Digit runs long enough to exceed 64 bits (may also hit digits inside strings; that only costs speed)
+_LONG_INT_RE = re.compile(r"(?<![\d.])\d{19,}")
+
+
+def _json_loads(text: str) -> Any:
+    # orjson silently turns integers beyond 64 bits into floats, so any text that might hold one goes to stdlib json.
+    if orjson is not None and not _LONG_INT_RE.search(text):
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _read_readme_cache(cache_path: Path, seed_url: str) -> Optional[Dict[str, Any]]:
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("url") != seed_url or not isinstance(cached.get("schema"), dict):
+        return None
+    return cached
+
+
+def _load_readme_schema(
+    seed_url: str, *, timeout_s: int = 30, cache_path: Optional[Path] = None
+) -> Optional[Dict[str, Any]]:
+    cached = _read_readme_cache(cache_path, seed_url) if cache_path is not None else None
+
+    # Revalidate the cached schema with a conditional GET; an unchanged page is just a 304.
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        if isinstance(cached.get("etag"), str):
+            headers["If-None-Match"] = cached["etag"]
+        if isinstance(cached.get("lastModified"), str):
+            headers["If-Modified-Since"] = cached["lastModified"]
+
+    resp = requests.get(seed_url, headers=headers, timeout=timeout_s)
+    if resp.status_code == 304 and cached is not None:
+        return cached["schema"]
     if resp.status_code != 200:
         return None
 
-    text = resp.text
-    m = re.search(r'data-initial-props="(.*?)"', text, flags=re.S)
+    # ReadMe embeds a large JSON state in the `ssr-props` script tag.
+    # Scan the raw bytes and decode/unescape only the matched attribute, not the whole page.
+    m = _INITIAL_PROPS_RE.search(resp.content)
     if not m:
         return None
 
     try:
-        props = json.loads(html_lib.unescape(m.group(1)))
+        props = _json_loads(html_lib.unescape(m.group(1).decode("utf-8", "replace")))
     except Exception:
         return None
 
     schema = props.get("document", {}).get("api", {}).get("schema")
-    return schema if isinstance(schema, dict) else None
+    if not isinstance(schema, dict):
+        return None
+
+    if cache_path is not None and (resp.headers.get("ETag") or resp.headers.get("Last-Modified")):
+        entry = {
+            "url": seed_url,
+            "etag": resp.headers.get("ETag"),
+            "lastModified": resp.headers.get("Last-Modified"),
+            "schema": schema,
+        }
+        try:
+            cache_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        except OSError:
+            pass
+    return schema
+
+
+def _choose_readme_response(responses: Any) -> Optional[Tuple[str, Dict[str, Any]]]:
+    if not isinstance(responses, dict):
+        return None
+    for st in ("200", "201", "202", "default"):
+        if st in responses and isinstance(responses[st], dict):
+            return st, responses[st]
+    for st, r in responses.items():
+        if isinstance(r, dict):
+            return str(st), r
+    return None
 
 
-def _iter_params(op: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+def _params(op: Dict[str, Any]) -> Sequence[Dict[str, Any]]:
     params = op.get("parameters")
-    if isinstance(params, list):
-        for p in params:
-            if isinstance(p, dict):
-                yield p
+    if not isinstance(params, list) or not params:
+        # Most paths/operations define none; share one empty tuple instead of allocating lists.
+        return ()
+    return [p for p in params if isinstance(p, dict)]
 
 
 def build_dataset(openapi: Dict[str, Any], *, readme_schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -233,10 +416,41 @@ def build_dataset(openapi: Dict[str, Any], *, readme_schema: Optional[Dict[str,
         if isinstance(readme_schema, dict)
         else {}
     )
-    example_builder = _ExampleBuilder(readme_components) if isinstance(readme_components, dict) else None
+
+    # Pick the ReadMe response to synthesize examples from once per (path, method), up front.
+    readme_responses: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
+    if isinstance(readme_paths, dict) and isinstance(readme_components, dict):
+        for readme_path, readme_pi in readme_paths.items():
+            if not isinstance(readme_pi, dict):
+                continue
+            for readme_method, readme_op in readme_pi.items():
+                if readme_method not in _HTTP_METHODS or not isinstance(readme_op, dict):
+                    continue
+                chosen = _choose_readme_response(readme_op.get("responses"))
+                if chosen is not None:
+                    readme_responses[(readme_path, readme_method)] = chosen
+
+    # Most endpoints never need a synthesized example, so only build the helper on first use.
+    example_builder: Optional[_ExampleBuilder] = None
+
+    def get_example_builder() -> _ExampleBuilder:
+        nonlocal example_builder
+        if example_builder is None:
+            example_builder = _ExampleBuilder(readme_components, max_depth=_DATASET_EXAMPLE_MAX_DEPTH)
+        return example_builder
 
     endpoints: List[Dict[str, Any]] = []
 
+    # Identical examples (e.g. shared error payloads) are stored once and referenced by content hash.
+    examples_by_hash: Dict[str, Any] = {}
+
+    def intern_example(example: Any) -> str:
+        h = hashlib.blake2b(
+            json.dumps(example, sort_keys=True, ensure_ascii=False).encode("utf-8"), digest_size=8
+        ).hexdigest()
+        examples_by_hash.setdefault(h, example)
+        return h
+
     # For relationships
     schema_to_endpoints: defaultdict[str, Set[str]] = defaultdict(set)
     tag_to_endpoints: defaultdict[str, Set[str]] = defaultdict(set)
@@ -245,9 +459,9 @@ def build_dataset(openapi: Dict[str, Any], *, readme_schema: Optional[Dict[str,
         if not isinstance(path_item, dict):
             continue
 
-        common_params = list(_iter_params(path_item))
+        common_params = _params(path_item)
 
-        for method in ("get", "post", "put", "patch", "delete", "head", "options"):
+        for method in _HTTP_METHODS:
             op = path_item.get(method)
             if not isinstance(op, dict):
                 continue
@@ -261,7 +475,8 @@ def build_dataset(openapi: Dict[str, Any], *, readme_schema: Optional[Dict[str,
 
             tags = [t for t in op.get("tags", []) if isinstance(t, str)] if isinstance(op.get("tags"), list) else []
 
-            params = common_params + list(_iter_params(op))
+            op_params = _params(op)
+            params = chain(common_params, op_params) if common_params else op_params
 
             query_params: List[Dict[str, Any]] = []
             path_params: List[Dict[str, Any]] = []
@@ -290,7 +505,8 @@ def build_dataset(openapi: Dict[str, Any], *, readme_schema: Optional[Dict[str,
 
             responses = op.get("responses")
             response_examples: List[Dict[str, Any]] = []
-            response_schema_refs: Set[str] = set()
+            # One scan over the whole responses object collects every component schema it references.
+            response_schema_refs = _collect_schema_refs(responses) if isinstance(responses, dict) else set()
 
             if isinstance(responses, dict):
                 for status, resp in responses.items():
@@ -299,13 +515,6 @@ def build_dataset(openapi: Dict[str, Any], *, readme_schema: Optional[Dict[str,
 
                     example = _pick_response_example(resp)
 
-                    # collect schema refs in responses
-                    content = resp.get("content")
-                    if isinstance(content, dict):
-                        for media in content.values():
-                            if isinstance(media, dict) and isinstance(media.get("schema"), dict):
-                                response_schema_refs |= _collect_schema_refs(media["schema"])
-
                     if example is not None:
                         response_examples.append(
                             {
@@ -313,46 +522,28 @@ def build_dataset(openapi: Dict[str, Any], *, readme_schema: Optional[Dict[str,
                                 "description": resp.get("description")
                                 if isinstance(resp.get("description"), str)
                                 else "",
-                                "example": _jsonable(example),
+                                "exampleRef": intern_example(_jsonable(example)),
                             }
                         )
 
             # If the published OpenAPI lacks examples, synthesize one from the ReadMe schema (which includes per-field examples).
-            if not response_examples and isinstance(readme_paths, dict) and example_builder is not None:
-                readme_pi = readme_paths.get(path)
-                if isinstance(readme_pi, dict):
-                    readme_op = readme_pi.get(method)
-                    if isinstance(readme_op, dict):
-                        readme_resps = readme_op.get("responses")
-                        chosen_status = None
-                        chosen_resp = None
-                        if isinstance(readme_resps, dict):
-                            for st in ("200", "201", "202", "default"):
-                                if st in readme_resps and isinstance(readme_resps[st], dict):
-                                    chosen_status = st
-                                    chosen_resp = readme_resps[st]
-                                    break
-                            if chosen_resp is None:
-                                for st, r in readme_resps.items():
-                                    if isinstance(r, dict):
-                                        chosen_status = str(st)
-                                        chosen_resp = r
-                                        break
-
-                        if isinstance(chosen_resp, dict):
-                            schema = _get_media_schema(chosen_resp)
-                            if isinstance(schema, dict):
-                                ex = example_builder.build(schema)
-                                if ex is not None and ex != {} and ex != []:
-                                    response_examples.append(
-                                        {
-                                            "status": str(chosen_status or "200"),
-                                            "description": chosen_resp.get("description")
-                                            if isinstance(chosen_resp.get("description"), str)
-                                            else "",
-                                            "example": _jsonable(ex),
-                                        }
-                                    )
+            if not response_examples and readme_responses:
+                chosen = readme_responses.get((path, method))
+                if chosen is not None:
+                    chosen_status, chosen_resp = chosen
+                    schema = _get_media_schema(chosen_resp)
+                    if isinstance(schema, dict):
+                        ex = get_example_builder().build(schema)
+                        if ex is not None and ex != {} and ex != []:
+                            response_examples.append(
+                                {
+                                    "status": chosen_status,
+                                    "description": chosen_resp.get("description")
+                                    if isinstance(chosen_resp.get("description"), str)
+                                    else "",
+                                    "exampleRef": intern_example(_jsonable(ex)),
+                                }
+                            )
 
             endpoint = {
                 "id": operation_id,
@@ -378,47 +569,28 @@ def build_dataset(openapi: Dict[str, Any], *, readme_schema: Optional[Dict[str,
     # Note: multiple heuristics can connect the same endpoint pair (e.g. both shared tag and shared schema).
     # Cytoscape will render parallel edges as multiple arrows, which looks like duplicates.
     # De-duplicate by (source, target), while preserving the set of edge types/keys.
-    edges_by_pair: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    # Kept as (types, keys) lists per pair while building; edge dicts are only materialized once at the end.
+    edges_by_pair: Dict[Tuple[str, str], Tuple[List[str], List[str]]] = {}
 
     def _add_edge(source: str, target: str, edge_type: str, key: str) -> None:
-        pair = (source, target)
-        existing = edges_by_pair.get(pair)
+        existing = edges_by_pair.get((source, target))
         if existing is None:
-            edges_by_pair[pair] = {
-                "source": source,
-                "target": target,
-                "type": edge_type,
-                "types": [edge_type],
-                "key": key,
-                "keys": [key],
-            }
+            edges_by_pair[(source, target)] = ([edge_type], [key])
             return
 
-        types = existing.get("types")
-        if not isinstance(types, list):
-            types = []
+        types, keys = existing
         if edge_type not in types:
             types.append(edge_type)
-        existing["types"] = types
-
-        keys = existing.get("keys")
-        if not isinstance(keys, list):
-            keys = []
         if key not in keys:
             keys.append(key)
-        existing["keys"] = keys
-
-        # Back-compat fields used by older viewers
-        existing["type"] = "+".join(sorted({t for t in types if isinstance(t, str)}))
-        existing["key"] = ", ".join([k for k in keys if isinstance(k, str)])
 
     def add_edges_from_groups(groups: Dict[str, Set[str]], edge_type: str) -> None:
         for key, ids in groups.items():
-            ids_list = sorted(ids)
-            if len(ids_list) < 2:
+            if len(ids) < 2:
                 continue
+            ids_list = sorted(ids)
             # connect in a chain to avoid O(n^2) explosion
-            for a, b in zip(ids_list, ids_list[1:]):
+            for a, b in zip(ids_list, islice(ids_list, 1, None)):
                 _add_edge(a, b, edge_type, key)
 
     def _is_param_segment(seg: str) -> bool:
@@ -466,15 +638,46 @@ def build_dataset(openapi: Dict[str, Any], *, readme_schema: Optional[Dict[str,
                 if _is_direct_child_path(parent, child):
                     _add_edge(parent_id, by_path[child], "resource", f"{method} path")
 
-    edges: List[Dict[str, Any]] = list(edges_by_pair.values())
+    edges: List[Dict[str, Any]] = [
+        {
+            "source": source,
+            "target": target,
+            # Back-compat fields used by older viewers
+            "type": "+".join(sorted(types)),
+            "types": types,
+            "key": ", ".join(keys),
+            "keys": keys,
+        }
+        for (source, target), (types, keys) in edges_by_pair.items()
+    ]
 
     return {
         "info": _jsonable(openapi.get("info", {})),
         "endpoints": endpoints,
         "edges": edges,
+        "examples": examples_by_hash,
     }
 
 
+def _write_json(path: Path, data: Any, *, pretty: bool = True) -> None:
+    # orjson is much faster but builds the whole output as one bytes object before writing it.
+    # The stdlib fallback streams chunks into the open file, so it keeps peak memory lower.
+    # Output can differ in float spelling (1e16 vs 1e+16) and orjson writes NaN/Infinity as null.
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            path.write_bytes(orjson.dumps(data, option=option))
+            return
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; stdlib json handles those
+
+    with path.open("w", encoding="utf-8") as f:
+        if pretty:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Build a normalized endpoints dataset from an OpenAPI YAML.")
     parser.add_argument(
@@ -487,6 +690,16 @@ def main() -> int:
         default=str(Path(__file__).resolve().parents[1] / "data" / "endpoints.json"),
         help="Output JSON path (default: ./data/endpoints.json)",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write the dataset without indentation (smaller and faster to write/load).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore on-disk caches (parsed spec JSON and the ReadMe schema cache next to the spec).",
+    )
     parser.add_argument(
         "--no-docs-examples",
         action="store_true",
@@ -503,17 +716,18 @@ def main() -> int:
     spec_path = Path(args.spec)
     out_path = Path(args.out)
 
-    openapi = _load_openapi(spec_path)
+    openapi = _load_openapi(spec_path, use_cache=not args.no_cache)
 
     readme_schema = None
     if not args.no_docs_examples:
-        # Fetch the ReadMe-embedded schema once using the first endpoint as a seed.
+        # Fetch the ReadMe-embedded schema once using the first endpoint (in spec order) as a seed.
+        # Every reference page embeds the whole schema, so which endpoint it is doesn't matter.
+        paths_map = openapi.get("paths") or {}
         seed_slug = None
-        for p in sorted((openapi.get("paths") or {}).keys()):
-            pi = (openapi.get("paths") or {}).get(p)
+        for p, pi in paths_map.items():
             if not isinstance(pi, dict):
                 continue
-            for m in ("get", "post", "put", "patch", "delete"):
+            for m in _SEED_METHODS:
                 if isinstance(pi.get(m), dict):
                     seed_slug = _slug_for_endpoint(m, p)
                     break
@@ -522,7 +736,8 @@ def main() -> int:
 
         if seed_slug:
             seed_url = f"{args.docs_base.rstrip('/')}/{seed_slug}"
-            readme_schema = _load_readme_schema(seed_url)
+            readme_cache = None if args.no_cache else spec_path.parent / ".readme_cache.json"
+            readme_schema = _load_readme_schema(seed_url, cache_path=readme_cache)
             if readme_schema is None:
                 print(f"warning: failed to load ReadMe schema from {seed_url}; response examples may be empty")
         else:
@@ -531,8 +746,11 @@ def main() -> int:
     dataset = build_dataset(openapi, readme_schema=readme_schema)
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(dataset, ensure_ascii=False, indent=2), encoding="utf-8")
-    print(f"wrote {out_path} (endpoints={len(dataset['endpoints'])}, edges={len(dataset['edges'])})")
+    _write_json(out_path, dataset, pretty=not args.compact)
+    print(
+        f"wrote {out_path} (endpoints={len(dataset['endpoints'])}, edges={len(dataset['edges'])}, "
+        f"examples={len(dataset['examples'])})"
+    )
 
     return 0
 
@@ -1,16 +1,40 @@
+import asyncio
+import importlib.util
 import json
 import os
+import re
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-import requests
+import httpx
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DATASET_PATH = REPO_ROOT / "data" / "endpoints.json"
 RESPONSES_DIR = REPO_ROOT / "data" / "responses"
 
+_UNSAFE_FILENAME_RUN_RE = re.compile(r"[^A-Za-z0-9.\-]+")
+# Digit runs long enough to exceed 64 bits (may also hit digits inside strings; that only costs speed)
+_LONG_INT_RE = re.compile(rb"(?<![\d.])\d{19,}")
+
+# Concurrent in-flight requests; over HTTP/2 these are streams multiplexed on one connection.
+MAX_CONCURRENCY = 16
+# Global request rate across all in-flight calls (previously a fixed 0.15s sleep between serial calls).
+MAX_REQUESTS_PER_SECOND = 8.0
+RETRY_STATUSES = {429, 502, 503, 504}
+MAX_RETRIES = 3
+RETRY_BACKOFF_S = 0.3
+# HTTP/2 needs the optional `h2` package (pip install "httpx[http2]"); otherwise stay on HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 def load_dotenv(path: Path) -> None:
     if not path.exists():
@@ -45,7 +69,7 @@ def get_access_token(base_url: str, client_id: str, client_secret: str, erp_toke
         "client_secret": client_secret,
         "grant_type": "client_credentials",
     }
-    resp = requests.post(url, headers=headers, data=data, timeout=30)
+    resp = httpx.post(url, headers=headers, data=data, timeout=30, follow_redirects=True)
     if resp.status_code != 200:
         raise SystemExit(f"Auth failed: {resp.status_code} {resp.text[:500]}")
 
@@ -94,27 +118,104 @@ def iter_call_targets(endpoints: List[Dict[str, Any]]) -> Iterable[Tuple[str, st
 def safe_filename_for_endpoint(method: str, path: str) -> str:
     # Example: GET /v1/naturezas/{codigoNatureza} -> GET_v1_naturezas_codigoNatureza.json
     name = f"{method.upper()}_{path.strip('/')}"
-    name = name.replace("/", "_")
     name = name.replace("{", "").replace("}", "")
-    # keep it filesystem-friendly
-    keep = []
-    for ch in name:
-        if ch.isalnum() or ch in {"_", "-", "."}:
-            keep.append(ch)
-        else:
-            keep.append("_")
-    cleaned = "".join(keep)
-    while "__" in cleaned:
-        cleaned = cleaned.replace("__", "_")
-    return cleaned + ".json"
+    # keep it filesystem-friendly: any run of "/", "_" or other unsafe chars becomes a single "_"
+    return _UNSAFE_FILENAME_RUN_RE.sub("_", name) + ".json"
+
+
+class RateLimiter:
+    """Token bucket shared by all in-flight calls."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self._rate = rate
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            await asyncio.sleep(wait)
+
+
+def build_client(base_url: str, headers: Dict[str, str]) -> httpx.AsyncClient:
+    # Transport-level retries only cover connection failures; status retries happen in call_endpoint.
+    # Pool limits must go on the transport: the client ignores `limits=` when given an explicit transport.
+    transport = httpx.AsyncHTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        retries=MAX_RETRIES,
+        limits=httpx.Limits(max_connections=MAX_CONCURRENCY),
+    )
+    return httpx.AsyncClient(
+        base_url=base_url.rstrip("/"),
+        headers=headers,
+        timeout=30,
+        follow_redirects=True,
+        transport=transport,
+    )
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """Exponential backoff, but never shorter than the server's Retry-After (seconds or HTTP date)."""
+    delay = RETRY_BACKOFF_S * (2**attempt)
+    retry_after = resp.headers.get("Retry-After")
+    if not retry_after:
+        return delay
+    try:
+        wait = float(retry_after)
+    except ValueError:
+        try:
+            wait = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return delay
+    return max(delay, wait)
+
+
+async def call_endpoint(client: httpx.AsyncClient, limiter: RateLimiter, method: str, path: str) -> httpx.Response:
+    attempt = 0
+    while True:
+        await limiter.acquire()
+        resp = await client.request(method, path)
+        if resp.status_code not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+            return resp
+        await asyncio.sleep(_retry_delay(resp, attempt))
+        attempt += 1
+
+
+def _parse_json_body(resp: httpx.Response) -> Any:
+    # orjson silently turns integers beyond 64 bits into floats, so any body that might hold one goes to stdlib json.
+    if orjson is not None and not _LONG_INT_RE.search(resp.content):
+        try:
+            return orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
+            pass  # e.g. not UTF-8; let httpx decode with the declared charset
+    return resp.json()
 
 
-def write_success_response(method: str, path: str, resp: requests.Response) -> Path:
-    RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
+def _dumps(obj: Any) -> bytes:
+    # orjson output is equivalent but not always byte-identical to stdlib json:
+    # floats are spelled 1e16/1e-7 instead of 1e+16/1e-07, and NaN/Infinity become null.
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; stdlib json handles those
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_success_response(method: str, path: str, resp: httpx.Response) -> Path:
     out_path = RESPONSES_DIR / safe_filename_for_endpoint(method, path)
 
     payload: Dict[str, Any] = {
-        "request": {"method": method, "path": path, "url": resp.url},
+        "request": {"method": method, "path": path, "url": str(resp.url)},
         "response": {
             "status": resp.status_code,
             "headers": dict(resp.headers),
@@ -122,15 +223,48 @@ def write_success_response(method: str, path: str, resp: requests.Response) -> P
     }
 
     try:
-        payload["response"]["json"] = resp.json()
+        payload["response"]["json"] = _parse_json_body(resp)
     except ValueError:
         # Not JSON; still save as JSON file by wrapping text.
         payload["response"]["text"] = resp.text
 
-    out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    out_path.write_bytes(_dumps(payload))
     return out_path
 
 
+async def survey(base_url: str, access_token: str, targets: List[Tuple[str, str, str, Dict[str, Any]]]) -> Tuple[int, int]:
+    limiter = RateLimiter(MAX_REQUESTS_PER_SECOND)
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    ok = 0
+    fail = 0
+
+    async def one(idx: int, method: str, path: str) -> None:
+        nonlocal ok, fail
+        async with sem:
+            try:
+                resp = await call_endpoint(client, limiter, method, path)
+            except httpx.RequestError as e:
+                fail += 1
+                print(f"[{idx}/{len(targets)}] {method} {path} -> ERROR: {e}")
+                return
+
+        if 200 <= resp.status_code < 300:
+            ok += 1
+            # Files are small; writing synchronously from the coroutine is fine.
+            out_path = write_success_response(method, path, resp)
+            print(f"[{idx}/{len(targets)}] {method} {path} -> {resp.status_code} (saved {out_path.relative_to(REPO_ROOT)})")
+        else:
+            fail += 1
+            print(f"[{idx}/{len(targets)}] {method} {path} -> {resp.status_code}")
+
+    async with build_client(base_url, {"Authorization": f"Bearer {access_token}"}) as client:
+        await asyncio.gather(
+            *(one(idx, method, path) for idx, (_, method, path, _) in enumerate(targets, start=1))
+        )
+
+    return ok, fail
+
+
 def main() -> int:
     load_dotenv(REPO_ROOT / ".env")
 
@@ -146,30 +280,12 @@ def main() -> int:
     dataset = json.loads(DATASET_PATH.read_text(encoding="utf-8"))
     endpoints: List[Dict[str, Any]] = dataset.get("endpoints") or []
 
-    headers = {"Authorization": f"Bearer {access_token}"}
-
     targets = list(iter_call_targets(endpoints))
     print(f"Will call {len(targets)} endpoints (safe auto-call subset)")
 
-    ok = 0
-    fail = 0
-
-    for idx, (eid, method, path, ep) in enumerate(targets, start=1):
-        url = base_url.rstrip("/") + path
-        try:
-            resp = requests.request(method, url, headers=headers, timeout=30)
-            if 200 <= resp.status_code < 300:
-                ok += 1
-                out_path = write_success_response(method, path, resp)
-                print(f"[{idx}/{len(targets)}] {method} {path} -> {resp.status_code} (saved {out_path.relative_to(REPO_ROOT)})")
-            else:
-                fail += 1
-                print(f"[{idx}/{len(targets)}] {method} {path} -> {resp.status_code}")
-        except requests.RequestException as e:
-            fail += 1
-            print(f"[{idx}/{len(targets)}] {method} {path} -> ERROR: {e}")
+    RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
 
-        time.sleep(0.15)
+    ok, fail = asyncio.run(survey(base_url, access_token, targets))
 
     print(f"Done. ok={ok} fail={fail}")
     print("Note: endpoints requiring path params or bodies were skipped.")
@@ -1,7 +1,9 @@
 import argparse
 import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 import requests
 
@@ -11,21 +13,31 @@ DEFAULT_SPECS = {
 }
 
 
-def _sha256_bytes(data: bytes) -> str:
-    h = hashlib.sha256()
-    h.update(data)
-    return h.hexdigest()
-
-
-def fetch(url: str, out_path: Path, *, timeout_s: int = 60) -> None:
+def fetch(url: str, out_path: Path, *, timeout_s: int = 60, session: Optional[requests.Session] = None) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    resp = requests.get(url, timeout=timeout_s)
-    resp.raise_for_status()
-    content = resp.content
-
-    out_path.write_bytes(content)
-    print(f"wrote {out_path} ({len(content)} bytes, sha256={_sha256_bytes(content)[:12]})")
+    # Hash and write in one pass over the streamed body instead of buffering it all.
+    # Stream into a temp file so a failed download never leaves a truncated spec behind.
+    part_path = out_path.with_name(out_path.name + ".part")
+    h = hashlib.sha256()
+    total = 0
+    http = session if session is not None else requests
+    try:
+        with http.get(url, timeout=timeout_s, stream=True) as resp:
+            resp.raise_for_status()
+            with part_path.open("wb") as f:
+                for chunk in resp.iter_content(chunk_size=1 << 16):
+                    if not chunk:
+                        continue
+                    h.update(chunk)
+                    f.write(chunk)
+                    total += len(chunk)
+        part_path.replace(out_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    print(f"wrote {out_path} ({total} bytes, sha256={h.hexdigest()[:12]})")
 
 
 def main() -> int:
@@ -51,9 +63,13 @@ def main() -> int:
     else:
         targets = {args.only: DEFAULT_SPECS[args.only]}
 
-    for name, url in targets.items():
+    def fetch_one(name: str, url: str) -> None:
         out_name = "api.yaml" if name == "sankhya" else "api-legada.yaml"
-        fetch(url, out_dir / out_name)
+        fetch(url, out_dir / out_name, session=session)
+
+    # Independent downloads from the same host: run them side by side over one shared session.
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        list(executor.map(fetch_one, targets.keys(), targets.values()))
 
     return 0
 